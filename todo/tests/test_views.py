@@ -1,23 +1,63 @@
-from django.test import TestCase
+from django.test import TestCase, Client, RequestFactory
 from django.contrib.auth.models import User
 from django.http import JsonResponse, HttpResponseNotAllowed
 from http import HTTPStatus
-from unittest import mock
+from json import dumps
 from todo.models import Todo
+from todo.views import todo_view, todo_detail_view
 from user.views import generate_access_token
 
+# Request bodies are serialized once instead of by the client on every request
+TODO_POST_BODY = dumps({"text": "Todo Text 11"}).encode()
+TODO_POST_INVALID_BODY = dumps({"no_text": "no_text"}).encode()
+TODO_PUT_BODY = dumps({"text": "Edit Text", "isCompleted": True}).encode()
 
-class TodoViewTest(TestCase):
+
+class JsonClient(Client):
+    """Test client sending application/json request bodies by default
+    Inherit :
+        Client
+    Method :
+        post : POST request with json content type
+        put  : PUT request with json content type
+    """
+
+    def post(self, path, data=None, content_type="application/json", **extra):
+        return super().post(path, data, content_type, **extra)
+
+    def put(self, path, data="", content_type="application/json", **extra):
+        return super().put(path, data, content_type, **extra)
+
+
+class BaseTodoViewTest(TestCase):
     @classmethod
-    def setUp(cls):
-        """Run each test case in TodoViewTest
+    def setUpTestData(cls):
+        """Run only once when running each todo view test class
         Test User Object 1 Fields :
             id           : 1
             username     : test1
         Test User Object 2 Fields :
             id           : 2
             username     : test2
+        """
+        cls.user1 = User.objects.create_user(username="test")
+        cls.user2 = User.objects.create_user(username="test2")
+
+        cls.user1_access_token = generate_access_token(cls.user1.username)
+        cls.user2_access_token = generate_access_token(cls.user2.username)
 
+        # Clients are shared by every test and send each user's access token
+        cls.user1_client = JsonClient(HTTP_AUTHORIZATION=cls.user1_access_token)
+        cls.user2_client = JsonClient(HTTP_AUTHORIZATION=cls.user2_access_token)
+
+        # Calls views directly, skipping url resolving and middleware
+        cls.factory = RequestFactory(HTTP_AUTHORIZATION=cls.user1_access_token)
+
+
+class TodoViewTest(BaseTodoViewTest):
+    @classmethod
+    def setUpTestData(cls):
+        """Run only once when running TodoViewTest
         Test Todo Object 1 ~ 5 Fields :
             id           : 1 ~ 5
             text         : Todo Text 1 ~ 5
@@ -30,29 +70,21 @@ class TodoViewTest(TestCase):
             is_completed : True
             user         : test2
         """
-        user1 = User.objects.create_user(username="test")
-        user1.save()
-
-        user2 = User.objects.create_user(username="test2")
-        user2.save()
-
-        for i in range(5):
-            todo = Todo.objects.create(text=f"Todo Text {i + 1}", user=user1)
-            todo.save()
-
-            todo = Todo.objects.create(
-                text=f"Todo Text {i + 6}", user=user2, is_completed=True
-            )
-            todo.save()
+        super().setUpTestData()
+
+        Todo.objects.bulk_create(
+            [Todo(text=f"Todo Text {i}", user=cls.user1) for i in range(1, 6)]
+            + [
+                Todo(text=f"Todo Text {i}", user=cls.user2, is_completed=True)
+                for i in range(6, 11)
+            ]
+        )
 
     def test_todo_view_get_success(self):
         """Todo application todo_view get method success test
         Check todo_view return JsonResponse with todo objects
         """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.get("/todo", HTTP_AUTHORIZATION=user1_access_token)
+        response = self.user1_client.get("/todo")
 
         self.assertIsInstance(response, JsonResponse)
         self.assertEqual(HTTPStatus.OK, response.status_code)
@@ -68,112 +100,31 @@ class TodoViewTest(TestCase):
         self.assertIn("isCompleted", data[0].keys())
         self.assertIn("text", data[0].keys())
 
-    def test_todo_view_post_success(self):
-        """Todo application todo_view post method success test
-        Check todo_view return JsonResponse with created object
-        """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.post(
-            "/todo",
-            data={"text": "Todo Text 11"},
-            content_type="application/json",
-            HTTP_AUTHORIZATION=user1_access_token,
-        )
-
-        self.assertIsInstance(response, JsonResponse)
-        self.assertEqual(HTTPStatus.OK, response.status_code)
-
-        json_response = response.json()
-
-        self.assertIn("data", json_response.keys())
-        self.assertEqual(
-            {"id": 11, "text": "Todo Text 11", "isCompleted": False, "user": 1},
-            json_response["data"],
-        )
-
-        todo = Todo.objects.get(text="Todo Text 11")
-
-        self.assertIsNotNone(todo)
-        self.assertEqual("Todo Text 11", todo.text)
-        self.assertFalse(todo.is_completed)
-
-    def test_todo_view_post_fail(self):
-        """Todo application todo_view post method fail test
-        Check todo_view return JsonResponse with error
-        """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.post(
-            "/todo",
-            data={"no_text": "no_text"},
-            content_type="application/json",
-            HTTP_AUTHORIZATION=user1_access_token,
-        )
-
-        self.assertIsInstance(response, JsonResponse)
-        self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR, response.status_code)
-
-        json_response = response.json()
-
-        self.assertIn("error", json_response.keys())
-        self.assertEqual(
-            "An error has occurred. Please try again.", json_response["error"]
-        )
-
     def test_todo_view_delete_success(self):
         """Todo application todo_view delete method success test
         Check todo_view return JsonResponse with error
         """
-        user2 = User.objects.get(id=2)
-        user2_access_token = generate_access_token(user2.username)
+        self.assertEqual(5, self.user2.todo_set.count())
 
-        response = self.client.delete("/todo", HTTP_AUTHORIZATION=user2_access_token)
+        response = self.user2_client.delete("/todo")
 
         self.assertIsInstance(response, JsonResponse)
         self.assertEqual(HTTPStatus.NO_CONTENT, response.status_code)
 
-        todos = user2.todo_set.all()
-
-        self.assertEqual(0, len(todos))
-
-    def test_todo_view_another_method(self):
-        """Todo application todo_view another method test
-        Check todo_view return return HttpResponseNotAllowed
-        """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.put("/todo", HTTP_AUTHORIZATION=user1_access_token,)
-
-        self.assertIsInstance(response, HttpResponseNotAllowed)
-        self.assertEqual(HTTPStatus.METHOD_NOT_ALLOWED, response.status_code)
+        self.assertEqual(0, self.user2.todo_set.count())
 
     def test_todo_detail_view_put_success(self):
         """Todo application todo_detail_view view put method success test
         Check todo_detail_view return JsonResponse with updated data
         """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.put(
-            "/todo/1",
-            data={"text": "Edit Text", "isCompleted": True},
-            content_type="application/json",
-            HTTP_AUTHORIZATION=user1_access_token,
-        )
+        response = self.user1_client.put("/todo/1", data=TODO_PUT_BODY)
 
         self.assertIsInstance(response, JsonResponse)
         self.assertEqual(HTTPStatus.OK, response.status_code)
 
-        json_response = response.json()
-
-        self.assertIn("data", json_response.keys())
         self.assertEqual(
-            {"id": 1, "text": "Edit Text", "isCompleted": True, "user": 1},
-            json_response["data"],
+            b'{"data": {"id": 1, "user": 1, "text": "Edit Text", "isCompleted": true}}',
+            response.content,
         )
 
         todo = Todo.objects.get(id=1)
@@ -182,38 +133,11 @@ class TodoViewTest(TestCase):
         self.assertEqual("Edit Text", todo.text)
         self.assertTrue(todo.is_completed)
 
-    def test_todo_detail_view_put_fail(self):
-        """Todo application todo_detail_view view put method fail test
-        Check todo_detail_view return JsonResponse with error
-        """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.put(
-            "/todo/11",
-            data={"text": "Edit Text", "isCompleted": True},
-            content_type="application/json",
-            HTTP_AUTHORIZATION=user1_access_token,
-        )
-
-        self.assertIsInstance(response, JsonResponse)
-        self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR, response.status_code)
-
-        json_response = response.json()
-
-        self.assertIn("error", json_response.keys())
-        self.assertEqual(
-            "An error has occurred. Please try again.", json_response["error"],
-        )
-
     def test_todo_detail_view_delete_success(self):
         """Todo application todo_detail_view view delete method success test
         Check todo_detail_view return JsonResponse with success status
         """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.delete("/todo/1", HTTP_AUTHORIZATION=user1_access_token)
+        response = self.user1_client.delete("/todo/1")
 
         self.assertIsInstance(response, JsonResponse)
         self.assertEqual(HTTPStatus.NO_CONTENT, response.status_code)
@@ -221,36 +145,69 @@ class TodoViewTest(TestCase):
         with self.assertRaises(Todo.DoesNotExist):
             Todo.objects.get(id=1)
 
-        todos = Todo.objects.all()
-        self.assertEqual(9, len(todos))
+        self.assertEqual(9, Todo.objects.count())
 
-    def test_todo_detail_view_delete_fail(self):
-        """Todo application todo_detail_view view delete method fail test
-        Check todo_detail_view return JsonResponse with error
-        """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
 
-        response = self.client.delete("/todo/11", HTTP_AUTHORIZATION=user1_access_token)
+class EmptyTodoViewTest(BaseTodoViewTest):
+    """Todo view tests which don't need any todo objects"""
 
-        self.assertIsInstance(response, JsonResponse)
-        self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR, response.status_code)
+    def test_todo_view_post_success(self):
+        """Todo application todo_view post method success test
+        Check todo_view return JsonResponse with created object
+        """
+        response = self.user1_client.post("/todo", data=TODO_POST_BODY)
 
-        json_response = response.json()
+        self.assertIsInstance(response, JsonResponse)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
 
-        self.assertIn("error", json_response.keys())
         self.assertEqual(
-            "An error has occurred. Please try again.", json_response["error"],
+            b'{"data": {"id": 1, "user": 1, "text": "Todo Text 11", '
+            b'"isCompleted": false}}',
+            response.content,
         )
 
+        todo = Todo.objects.get(text="Todo Text 11")
+
+        self.assertIsNotNone(todo)
+        self.assertEqual("Todo Text 11", todo.text)
+        self.assertFalse(todo.is_completed)
+
+    def test_todo_view_another_method(self):
+        """Todo application todo_view another method test
+        Check todo_view return return HttpResponseNotAllowed
+        """
+        response = todo_view(self.factory.put("/todo"))
+
+        self.assertIsInstance(response, HttpResponseNotAllowed)
+        self.assertEqual(HTTPStatus.METHOD_NOT_ALLOWED, response.status_code)
+
     def test_todo_detail_view_another_method(self):
         """Todo application todo_detail_view another method test
         Check todo_detail_view return HttpResponseNotAllowed
         """
-        user1 = User.objects.get(id=1)
-        user1_access_token = generate_access_token(user1.username)
-
-        response = self.client.get("/todo/1", HTTP_AUTHORIZATION=user1_access_token)
+        response = todo_detail_view(self.factory.get("/todo/1"), 1)
 
         self.assertIsInstance(response, HttpResponseNotAllowed)
         self.assertEqual(HTTPStatus.METHOD_NOT_ALLOWED, response.status_code)
+
+    def test_todo_views_fail(self):
+        """Todo application todo_view and todo_detail_view fail test
+        Check todo_view and todo_detail_view return JsonResponse with error
+        """
+        for method, path, data in (
+            ("post", "/todo", TODO_POST_INVALID_BODY),
+            ("put", "/todo/11", TODO_PUT_BODY),
+            ("delete", "/todo/11", ""),
+        ):
+            with self.subTest(method=method, path=path):
+                response = getattr(self.user1_client, method)(path, data)
+
+                self.assertIsInstance(response, JsonResponse)
+                self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR, response.status_code)
+
+                json_response = response.json()
+
+                self.assertIn("error", json_response.keys())
+                self.assertEqual(
+                    "An error has occurred. Please try again.", json_response["error"]
+                )
@@ -1,5 +1,7 @@
 from django.test import TestCase
+from jwt.exceptions import ExpiredSignatureError
 from user.utils.jwt import decode_jwt, encode_jwt
+from time import time
 
 
 class JsonWebTokenUtilTest(TestCase):
@@ -23,3 +25,22 @@ class JsonWebTokenUtilTest(TestCase):
         """
         data = decode_jwt(self.jwt)
         self.assertEqual(self.data, data)
+
+    def test_decode_jwt_expired(self):
+        """decode_jwt method expired token test
+        Check decode_jwt raise ExpiredSignatureError on every call
+        """
+        expired_jwt = encode_jwt({**self.data, "exp": time() - 1})
+
+        for _ in range(2):
+            with self.assertRaises(ExpiredSignatureError):
+                decode_jwt(expired_jwt)
+
+    def test_decode_jwt_returns_copy(self):
+        """decode_jwt method cached payload test
+        Check modifying decoded dict doesn't affect next decode_jwt result
+        """
+        data = decode_jwt(self.jwt)
+        data["key"] = "modified"
+
+        self.assertEqual(self.data, decode_jwt(self.jwt))
@@ -1,20 +1,50 @@
 import os
 import jwt
+from django.core.exceptions import ImproperlyConfigured
+from functools import lru_cache, partial
+from time import time
+from jwt.exceptions import ExpiredSignatureError
 
 
 JWT_ALGORITHM = os.environ.get("JWT_ALGORITHM")
 SECRET_KEY = os.environ.get("SECRET_KEY")
 
+# Fail at import instead of inside pyjwt on every request
+if not JWT_ALGORITHM or not SECRET_KEY:
+    raise ImproperlyConfigured(
+        "JWT_ALGORITHM and SECRET_KEY environment variables must be set."
+    )
+
+# Computed once instead of on every encode/decode call
+_ALGORITHMS = [JWT_ALGORITHM]
+_SECRET = SECRET_KEY.encode()
+
+# Shared codec with the decode options configured once
+_jwt = jwt.PyJWT(options={"verify_aud": False, "verify_exp": False})
+
+# Key, algorithm and issuer are bound once
+_encode = partial(_jwt.encode, key=_SECRET, algorithm=JWT_ALGORITHM)
+_decode = partial(
+    _jwt.decode, key=_SECRET, algorithms=_ALGORITHMS, issuer="Redux Todo Web Backend"
+)
+
 
 def encode_jwt(data):
-    return jwt.encode(data, SECRET_KEY, algorithm=JWT_ALGORITHM).decode("utf-8")
+    return _encode(data).decode("utf-8")
+
+
+@lru_cache(maxsize=1024)
+def _decode_verified_jwt(access_token):
+    # Signature and issuer are verified once per token.
+    # Expiration is time dependent, so decode_jwt checks it on every call.
+    return _decode(access_token)
 
 
 def decode_jwt(access_token):
-    return jwt.decode(
-        access_token,
-        SECRET_KEY,
-        algorithms=[JWT_ALGORITHM],
-        issuer="Redux Todo Web Backend",
-        options={"verify_aud": False},
-    )
+    payload = _decode_verified_jwt(access_token)
+
+    if "exp" in payload and payload["exp"] < time():
+        raise ExpiredSignatureError("Signature has expired")
+
+    # Return a copy so callers can't modify the cached payload
+    return dict(payload)